@@ -4,28 +4,12 @@ from __future__ import annotations
 
 __all__ = ["Camera"]
 
+import math
+
 import numpy as np
 from numpy.typing import NDArray
 
 
-def rotation_matrix(theta: float) -> NDArray[np.float64]:
-    """Return a 2-D rotation matrix from a given angle.
-
-    Parameters
-    ----------
-    theta : float
-        Angle in radians.
-
-    Returns
-    -------
-    numpy.ndarray
-        2-D rotation matrix.
-    """
-    x = np.cos(theta)
-    y = np.sin(theta)
-    return np.array([[x, y], [-y, x]], np.float64)
-
-
 class Camera:
     """A raycaster camera.
 
@@ -40,7 +24,7 @@ class Camera:
 
     Attributes
     ----------
-    pos : tuple[float, float]
+    pos : NDArray[np.float64]
         Position of camera on the map.
     theta : float
         Direction of camera in radians.
@@ -50,8 +34,6 @@ class Camera:
 
     Methods
     -------
-    rotation_matrix(theta)
-        Return a 2-D rotation matrix from a given angle.
     rotate(theta)
         Rotate camera `theta` radians in-place.
     """
@@ -62,7 +44,8 @@ class Camera:
         theta: float = 0.0,
         fov: float = 0.66,
     ) -> None:
-        self.pos = pos
+        self._pos: NDArray[np.float64] = np.array(pos, np.float64)
+        """Position of camera on the map."""
 
         if fov > 1.0:
             fov = 1.0
@@ -71,6 +54,10 @@ class Camera:
 
         self._plane: NDArray[np.float64] = np.empty((2, 2), np.float64)
         """Plane of camera."""
+        self._theta: float
+        """Direction of camera in radians."""
+        self._fov: float
+        """Field of view of camera."""
 
         self._build_plane(theta, fov)
 
@@ -85,8 +72,30 @@ class Camera:
             Field of view of camera. The field of view is a float
             between 0 and 1.
         """
-        initial_plane = np.array([[1.001, 0.001], [0.0, fov]], np.float64)
-        self._plane = initial_plane @ rotation_matrix(theta)
+        self._theta = theta % math.tau
+        self._fov = fov
+        c = math.cos(theta)
+        s = math.sin(theta)
+        plane = self._plane
+        plane[0, 0] = 1.001 * c - 0.001 * s
+        plane[0, 1] = 1.001 * s + 0.001 * c
+        plane[1, 0] = -fov * s
+        plane[1, 1] = fov * c
+
+    @property
+    def pos(self) -> NDArray[np.float64]:
+        """Position of camera on the map.
+
+        Returns
+        -------
+        NDArray[np.float64]
+            Position of camera on the map.
+        """
+        return self._pos
+
+    @pos.setter
+    def pos(self, pos: tuple[float, float]) -> None:
+        self._pos[:] = pos
 
     @property
     def theta(self) -> float:
@@ -97,8 +106,7 @@ class Camera:
         float
             Direction of camera in radians.
         """
-        x2, x1 = self._plane[0]
-        return np.arctan2(x1, x2)
+        return self._theta
 
     @theta.setter
     def theta(self, theta: float) -> None:
@@ -113,7 +121,7 @@ class Camera:
         float
             Field of view of camera.
         """
-        return np.linalg.norm(self._plane[1]).item()
+        return self._fov
 
     @fov.setter
     def fov(self, fov: float) -> None:
@@ -127,4 +135,12 @@ class Camera:
         theta : float
             Angle in radians.
         """
-        self._plane = self._plane @ rotation_matrix(theta)
+        self._theta = (self._theta + theta) % math.tau
+        c = math.cos(theta)
+        s = math.sin(theta)
+        plane = self._plane
+        (x0, y0), (x1, y1) = plane.tolist()
+        plane[0, 0] = x0 * c - y0 * s
+        plane[0, 1] = x0 * s + y0 * c
+        plane[1, 0] = x1 * c - y1 * s
+        plane[1, 1] = x1 * s + y1 * c
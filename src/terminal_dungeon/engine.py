@@ -2,9 +2,7 @@
 
 import curses
 import os
-import sys
 import signal
-from collections import defaultdict
 from dataclasses import dataclass
 from time import monotonic
 
@@ -14,9 +12,19 @@ from pynput import keyboard
 from pynput.keyboard import Key, KeyCode
 
 from . import _IS_WINDOWS
-from .camera import Camera, rotation_matrix
+from .camera import Camera
 from .raycaster import Raycaster
-from .sprite import Sprite
+from .sprite import Sprite, SpriteTexture
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain python.
+
+    def njit(*args, **kwargs):
+        """Return the decorated function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 KEY_BINDINGS: dict[str, Key | KeyCode] = {
     "quit": Key.esc,
@@ -33,11 +41,47 @@ KEY_BINDINGS: dict[str, Key | KeyCode] = {
     "strafe_right": KeyCode(char="e"),
 }
 
-STRAFE_ROT = rotation_matrix(3 * np.pi / 2)
+
+@njit(cache=True)
+def _next_position(
+    game_map: NDArray[np.uint32], old_x: float, old_y: float, x: float, y: float
+) -> tuple[float, float]:
+    """Return the position closest to `(x, y)` that isn't inside a wall.
+
+    Parameters
+    ----------
+    game_map : NDArray[np.uint32]
+        A 2D integer numpy array with nonzero entries representing walls.
+    old_x : float
+        Current x-coordinate.
+    old_y : float
+        Current y-coordinate.
+    x : float
+        Desired x-coordinate.
+    y : float
+        Desired y-coordinate.
+
+    Returns
+    -------
+    tuple[float, float]
+        The new position.
+    """
+    ix = int(x)
+    iy = int(y)
+    old_ix = int(old_x)
+    old_iy = int(old_y)
+
+    if game_map[ix, iy] == 0:
+        return x, y
+    if game_map[ix, old_iy] == 0:
+        return x, old_y
+    if game_map[old_ix, iy] == 0:
+        return old_x, y
+    return old_x, old_y
 
 
 def _move_to(
-    camera: Camera, game_map: NDArray[np.uint32], pos: tuple[float, float]
+    camera: Camera, game_map: NDArray[np.uint32], pos: NDArray[np.float64]
 ) -> None:
     """Move the camera as close to new position as possible considering walls.
 
@@ -47,18 +91,13 @@ def _move_to(
         The camera to move.
     game_map : NDArray[np.uint32]
         A 2D integer numpy array with nonzero entries representing walls.
-    pos : tuple[float, float]
+    pos : NDArray[np.float64]
         The new position for the camera.
     """
-    old_x, old_y = camera.pos
-    x, y = pos
-
-    if game_map[int(x), int(y)] == 0:
-        camera.pos = x, y
-    elif game_map[int(x), int(old_y)] == 0:
-        camera.pos = x, old_y
-    elif game_map[int(old_x), int(y)] == 0:
-        camera.pos = old_x, y
+    cam_pos = camera.pos
+    cam_pos[0], cam_pos[1] = _next_position(
+        game_map, cam_pos[0], cam_pos[1], pos[0], pos[1]
+    )
 
 
 @dataclass
@@ -75,7 +114,7 @@ class Engine:
         A list of sprites.
     wall_textures : list[NDArray[np.uint8]]
         A list of wall textures.
-    sprite_textures : list[NDArray[np.str_]]
+    sprite_textures : list[terminal_dungeon.sprite.SpriteTexture]
         A list of sprite textures.
     rotation_speed : float, default: 3.0
         Speed with which the camera rotates.
@@ -107,7 +146,7 @@ class Engine:
     """A list of sprites."""
     wall_textures: list[NDArray[np.uint8]]
     """A list of wall textures."""
-    sprite_textures: list[NDArray[np.str_]]
+    sprite_textures: list[SpriteTexture]
     """A list of sprite textures."""
     rotation_speed: float = 3.0
     """Speed with which the camera rotates."""
@@ -115,8 +154,22 @@ class Engine:
     """Speed with which the camera translates."""
 
     def __post_init__(self) -> None:
+        # Keep a single C-contiguous uint32 signature for the jitted `_next_position`.
+        self.game_map = np.ascontiguousarray(self.game_map, np.uint32)
         self.caster = Raycaster(self)
         """The raycaster for the engine."""
+        self._next_pos: NDArray[np.float64] = np.zeros(2, np.float64)
+        """Scratch buffer for the camera's next position."""
+
+        # Resolve key bindings once so the frame loop avoids dict lookups.
+        self._k_quit = KEY_BINDINGS["quit"]
+        self._k_toggle_texture = KEY_BINDINGS["toggle_texture"]
+        self._k_fwd = KEY_BINDINGS["forward_1"], KEY_BINDINGS["forward_2"]
+        self._k_back = KEY_BINDINGS["backward_1"], KEY_BINDINGS["backward_2"]
+        self._k_left = KEY_BINDINGS["turn_left_1"], KEY_BINDINGS["turn_left_2"]
+        self._k_right = KEY_BINDINGS["turn_right_1"], KEY_BINDINGS["turn_right_2"]
+        self._k_strafe_left = KEY_BINDINGS["strafe_left"]
+        self._k_strafe_right = KEY_BINDINGS["strafe_right"]
 
     def run(self) -> None:
         """Run the game engine."""
@@ -138,14 +191,15 @@ class Engine:
         caster = self.caster
         resized: bool = True
 
-        pressed_keys = defaultdict(bool)
+        pressed_keys = {key: False for key in KEY_BINDINGS.values()}
 
         def on_press(key: Key | KeyCode | None):
-            pressed_keys[key] = True
-            print(key, file=sys.stderr)
+            if key in pressed_keys:
+                pressed_keys[key] = True
 
         def on_release(key: Key | KeyCode | None):
-            pressed_keys[key] = False
+            if key in pressed_keys:
+                pressed_keys[key] = False
 
         def set_resized(*_):
             nonlocal resized
@@ -160,7 +214,8 @@ class Engine:
         try:
             last_time = monotonic()
 
-            while not pressed_keys[KEY_BINDINGS["quit"]]:
+            quit_key = self._k_quit
+            while not pressed_keys[quit_key]:
                 current_time = monotonic()
                 dt = current_time - last_time
                 last_time = current_time
@@ -171,9 +226,8 @@ class Engine:
 
                 caster.cast()
 
-                for row_num, row in enumerate(caster.buffer):
-                    screen.addstr(row_num, 0, "".join(row))
-                    screen.refresh()
+                screen.addstr(0, 0, caster.frame)
+                screen.refresh()
 
                 self._handle_keys(pressed_keys, dt)
 
@@ -203,13 +257,13 @@ class Engine:
             curses.resizeterm(height, width)
         self.caster.resize(width - 1, height)
 
-    def _handle_keys(self, pressed_keys: defaultdict, dt: float) -> None:
+    def _handle_keys(self, pressed_keys: dict[Key | KeyCode, bool], dt: float) -> None:
         """Handle key presses.
 
         Parameters
         ----------
-        pressed_keys : defaultdict
-            A dictionary of pressed keys.
+        pressed_keys : dict[Key | KeyCode, bool]
+            Whether each bound key is pressed.
         dt : float
             Time since last frame in.
         """
@@ -217,47 +271,44 @@ class Engine:
         caster = self.caster
         game_map = self.game_map
 
-        if pressed_keys[KEY_BINDINGS["toggle_texture"]]:
-            pressed_keys[KEY_BINDINGS["toggle_texture"]] = False
+        pk = pressed_keys
+        if pk[self._k_toggle_texture]:
+            pk[self._k_toggle_texture] = False
             caster.toggle_textures()
 
-        def _is_pressed(*args):
-            """Check if any of the keys are pressed.
-
-            Parameters
-            ----------
-            *args : str
-                The keys to check.
-            """
-            return any(pressed_keys[KEY_BINDINGS[arg]] for arg in args)
-
-        left = _is_pressed("turn_left_1", "turn_left_2")
-        right = _is_pressed("turn_right_1", "turn_right_2")
-        forward = _is_pressed("forward_1", "forward_2")
-        backward = _is_pressed("backward_1", "backward_2")
-        strafe_left = _is_pressed("strafe_left")
-        strafe_right = _is_pressed("strafe_right")
+        left = pk[self._k_left[0]] or pk[self._k_left[1]]
+        right = pk[self._k_right[0]] or pk[self._k_right[1]]
+        forward = pk[self._k_fwd[0]] or pk[self._k_fwd[1]]
+        backward = pk[self._k_back[0]] or pk[self._k_back[1]]
+        strafe_left = pk[self._k_strafe_left]
+        strafe_right = pk[self._k_strafe_right]
 
         if left and not right:
             camera.rotate(-self.rotation_speed * dt)
         elif right and not left:
             camera.rotate(self.rotation_speed * dt)
 
+        next_pos = self._next_pos
+        step = self.translation_speed * dt
+        direction = camera._plane[0]
+
         if forward and not backward:
-            next_pos = self.translation_speed * dt * camera._plane[0] + camera.pos
+            np.multiply(direction, step, out=next_pos)
+            next_pos += camera.pos
             _move_to(camera, game_map, next_pos)
         elif backward and not forward:
-            next_pos = -self.translation_speed * dt * camera._plane[0] + camera.pos
+            np.multiply(direction, -step, out=next_pos)
+            next_pos += camera.pos
             _move_to(camera, game_map, next_pos)
 
+        # Strafing moves perpendicular to the camera's direction.
         if strafe_left and not strafe_right:
-            next_pos = (
-                self.translation_speed * dt * camera._plane[0] @ STRAFE_ROT + camera.pos
-            )
+            dx, dy = direction
+            next_pos[0] = camera.pos[0] + step * dy
+            next_pos[1] = camera.pos[1] - step * dx
             _move_to(camera, game_map, next_pos)
         elif strafe_right and not strafe_left:
-            next_pos = (
-                self.translation_speed * dt * camera._plane[0] @ -STRAFE_ROT
-                + camera.pos
-            )
+            dx, dy = direction
+            next_pos[0] = camera.pos[0] - step * dy
+            next_pos[1] = camera.pos[1] + step * dx
             _move_to(camera, game_map, next_pos)
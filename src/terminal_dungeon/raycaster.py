@@ -64,6 +64,10 @@ class Raycaster:
         """Width of caster's buffer."""
         self.buffer = np.full((height, width), " ")
         """The array in which the caster renders."""
+        self._rows = self.buffer.view(f"U{width}").ravel()
+        """Each row of buffer viewed as a single string."""
+        self._codepoints = self.buffer.view(np.uint32)
+        """Buffer viewed as unicode codepoints."""
 
         # Precalculate angle of rays cast.
         self._ray_angles = angles = np.ones((width, 2), dtype=float)
@@ -80,6 +84,11 @@ class Raycaster:
         self._tex_int = np.zeros_like(weights, dtype=int)
         self._column_distances = np.zeros((width,), dtype=float)
 
+    @property
+    def frame(self) -> str:
+        """The caster's buffer joined into a single newline-separated string."""
+        return "\n".join(self._rows)
+
     def cast(self) -> None:
         """Cast rays and sprites and render minimap into buffer."""
         self.buffer[:] = " "
@@ -204,7 +213,7 @@ class Raycaster:
             if sprite_height == 0 or sprite_width == 0:
                 continue
             tex = sprite_textures[sprite.texture_index]
-            tex_width, tex_height = tex.shape
+            tex_width, tex_height = tex.codepoints.shape
 
             start_x = _clamp(0, -sprite_width // 2 + sprite_x, w)
             end_x = _clamp(0, sprite_width // 2 + sprite_x, w)
@@ -222,9 +231,13 @@ class Raycaster:
             rows *= tex_height / sprite_height
             np.clip(rows, 0, None, out=rows)
 
-            tex_rect = tex[tex_xs.astype(int)][:, rows.astype(int)].T
-            self.buffer[start_y:end_y, columns] = np.where(
-                tex_rect != "0", tex_rect, self.buffer[start_y:end_y, columns]
+            tex_xs = tex_xs.astype(int)[:, None]
+            tex_ys = rows.astype(int)
+            tex_rect = tex.codepoints[tex_xs, tex_ys].T
+            mask_rect = tex.mask[tex_xs, tex_ys].T
+            dst = self._codepoints
+            dst[start_y:end_y, columns] = np.where(
+                mask_rect, dst[start_y:end_y, columns], tex_rect
             )
 
     def _render_minimap(self) -> None:
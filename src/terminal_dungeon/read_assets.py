@@ -22,7 +22,57 @@ from pathlib import Path
 import numpy as np
 from numpy.typing import NDArray
 
-from .sprite import Sprite
+from .sprite import Sprite, SpriteTexture
+
+
+def _read_ascii(path: Path) -> NDArray[np.uint8]:
+    """Read a rectangular ascii text file into an array of character codes.
+
+    Parameters
+    ----------
+    path : Path
+        Path to text file.
+
+    Returns
+    -------
+    NDArray[np.uint8]
+        A 2D array of character codes with shape (rows, columns).
+
+    Raises
+    ------
+    ValueError
+        If the lines of the file aren't all the same length.
+    """
+    lines = path.read_bytes().splitlines()
+    width = len(lines[0])
+    if any(len(line) != width for line in lines):
+        raise ValueError(f"{path} has lines of different lengths.")
+    chars = np.frombuffer(b"".join(lines), dtype=np.uint8)
+    return chars.reshape(len(lines), width)
+
+
+def _read_digits(path: Path) -> NDArray[np.uint8]:
+    """Read a rectangular text file of digits into an array.
+
+    Parameters
+    ----------
+    path : Path
+        Path to text file.
+
+    Returns
+    -------
+    NDArray[np.uint8]
+        A 2D array of digits with shape (rows, columns).
+
+    Raises
+    ------
+    ValueError
+        If the file contains a character that isn't a digit.
+    """
+    digits = _read_ascii(path) - ord("0")
+    if (digits > 9).any():
+        raise ValueError(f"{path} contains non-digit characters.")
+    return digits
 
 
 def read_map(path: Path) -> NDArray[np.uint32]:
@@ -38,10 +88,8 @@ def read_map(path: Path) -> NDArray[np.uint32]:
     NDArray[np.uint32]
         A 2D integer numpy array with nonzero entries representing walls.
     """
-    text = path.read_text()
-    return np.array(
-        [[int(cell) for cell in line] for line in text.splitlines()], dtype=np.uint32
-    ).T
+    digits = _read_digits(path)
+    return digits.astype(np.uint32).T.copy()
 
 
 def read_wall_textures(*paths: Path) -> list[NDArray[np.uint8]]:
@@ -62,13 +110,12 @@ def read_wall_textures(*paths: Path) -> list[NDArray[np.uint8]]:
     """
 
     def _read_wall(path):
-        text = path.read_text()
-        return np.array([[int(cell) for cell in line] for line in text.splitlines()]).T
+        return _read_digits(path).T
 
     return [_read_wall(path) for path in paths]
 
 
-def read_sprite_textures(*paths: Path) -> list[NDArray[np.str_]]:
+def read_sprite_textures(*paths: Path) -> list[SpriteTexture]:
     r"""Read sprite textures from text files.
 
     Sprite textures can be any text with the caveat that "0" represents a transparent
@@ -81,13 +128,17 @@ def read_sprite_textures(*paths: Path) -> list[NDArray[np.str_]]:
 
     Returns
     -------
-    list[NDArray[np.str_]]
+    list[SpriteTexture]
         A list of sprite textures.
     """
 
     def _read_sprite(path):
-        text = path.read_text()
-        return np.array([list(line) for line in text.splitlines()]).T
+        lines = path.read_text().splitlines()
+        h = len(lines)
+        w = len(lines[0])
+        buf = "".join(lines).encode("utf-32-le")
+        codepoints = np.frombuffer(buf, dtype=np.uint32).reshape(h, w).T
+        return SpriteTexture(codepoints, codepoints == ord("0"))
 
     return [_read_sprite(path) for path in paths]
 
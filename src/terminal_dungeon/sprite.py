@@ -2,6 +2,9 @@
 
 from dataclasses import dataclass
 
+import numpy as np
+from numpy.typing import NDArray
+
 
 @dataclass
 class Sprite:
@@ -15,4 +18,19 @@ class Sprite:
         Index of sprite texture.
     """
     pos: tuple[float, float]
-    texture_index: int
\ No newline at end of file
+    texture_index: int
+
+
+@dataclass
+class SpriteTexture:
+    """A sprite texture for a raycaster.
+
+    Parameters
+    ----------
+    codepoints : NDArray[np.uint32]
+        Unicode codepoints of the texture's characters.
+    mask : NDArray[np.bool_]
+        True where the texture is transparent.
+    """
+    codepoints: NDArray[np.uint32]
+    mask: NDArray[np.bool_]